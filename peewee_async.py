@@ -236,6 +236,24 @@ class ConnectionContextManager:
             connection_context.set(None)
 
 
+class AllowSyncContextManager:
+    def __init__(self, database):
+        self.database = database
+        self.old_allow_sync = None
+
+    def __enter__(self):
+        self.old_allow_sync = self.database._allow_sync
+        self.database._allow_sync = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.database._allow_sync = self.old_allow_sync
+        try:
+            self.database.close()
+        except self.database.Error:
+            pass  # already closed
+
+
 class PoolBackend(metaclass=abc.ABCMeta):
     """Asynchronous database connection pool.
     """
@@ -338,7 +356,6 @@ class AioDatabase:
         """
         self._allow_sync = value
 
-    @contextlib.contextmanager
     def allow_sync(self):
         """Allow sync queries within context. Close sync
         connection on exit if connected.
@@ -348,19 +365,7 @@ class AioDatabase:
             with database.allow_sync():
                 PageBlock.create_table(True)
         """
-        old_allow_sync = self._allow_sync
-        self._allow_sync = True
-
-        try:
-            yield
-        except:
-            raise
-        finally:
-            self._allow_sync = old_allow_sync
-            try:
-                self.close()
-            except self.Error:
-                pass  # already closed
+        return AllowSyncContextManager(self)
 
     def execute_sql(self, *args, **kwargs):
         """Sync execute SQL query, `allow_sync` must be set to True.
@@ -725,6 +730,35 @@ class AioSelectMixin(AioQueryMixin):
                                           'not exist:\nSQL: %s\nParams: %s' %
                                           (clone.model, sql, params))
 
+    @peewee.database_required
+    async def aio_iterator(self, database):
+        """Execute the *SELECT* query and iterate over rows as they are
+        fetched from the cursor, without materializing the whole result
+        in memory, i.e. for processing large query results.
+
+        Example::
+
+            async for obj in TestModel.select().aio_iterator():
+                ...
+        """
+        sql, params = database.get_sql_context().sql(self).query()
+        with peewee.__exception_wrapper__:
+            async with database.aio_connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(sql, params or ())
+                    rows = []
+                    rows_cursor = RowsCursor(rows, cursor.description)
+                    result_wrapper = self._get_cursor_wrapper(rows_cursor)
+                    while True:
+                        row = await cursor.fetchone()
+                        if row is None:
+                            break
+                        rows.append(row)
+                        yield result_wrapper.iterate(False)
+                        # Only the current row stays buffered.
+                        rows.clear()
+                        rows_cursor._idx = 0
+
     @peewee.database_required
     async def aio_count(self, database, clear_limit=False):
         clone = self.order_by().alias('_wrapped')
@@ -31,6 +31,16 @@ async def test_raw_select(db):
     assert list(result) == [obj1, obj2]
 
 
+@dbs_all
+async def test_aio_iterator(db):
+    obj1 = await TestModel.aio_create(text="Test 1")
+    obj2 = await TestModel.aio_create(text="Test 2")
+
+    query = TestModel.select().order_by(TestModel.text)
+    result = [obj async for obj in query.aio_iterator()]
+    assert result == [obj1, obj2]
+
+
 @manager_for_all_dbs
 async def test_select_compound(manager):
     obj1 = await manager.create(TestModel, text="Test 1")
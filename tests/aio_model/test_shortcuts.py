@@ -1,5 +1,3 @@
-import uuid
-
 import peewee
 import pytest
 from peewee import fn
@@ -51,8 +49,9 @@ async def test_aio_scalar(db):
 @dbs_all
 async def test_count_query(db):
 
-    for num in range(5):
-        await IntegerTestModel.aio_create(num=num)
+    await IntegerTestModel.insert_many([
+        {'num': num} for num in range(5)
+    ]).aio_execute()
     count = await IntegerTestModel.select().limit(3).aio_count()
     assert count == 3
 
@@ -60,16 +59,16 @@ async def test_count_query(db):
 @dbs_all
 async def test_count_query_clear_limit(db):
 
-    for num in range(5):
-        await IntegerTestModel.aio_create(num=num)
+    await IntegerTestModel.insert_many([
+        {'num': num} for num in range(5)
+    ]).aio_execute()
     count = await IntegerTestModel.select().limit(3).aio_count(clear_limit=True)
     assert count == 5
 
 
 @dbs_all
 async def test_aio_delete_instance(db):
-    text = "Test %s" % uuid.uuid4()
-    obj1 = await TestModel.aio_create(text=text)
+    obj1 = await TestModel.aio_create(text="Test delete instance")
     obj2 = await TestModel.aio_get(id=obj1.id)
 
     await obj2.aio_delete_instance()
@@ -24,12 +24,9 @@ async def test_get_or_none(manager):
 
 @manager_for_all_dbs
 async def test_count_query_with_limit(manager):
-    text = "Test %s" % uuid.uuid4()
-    await manager.create(CompatTestModel, text=text)
-    text = "Test %s" % uuid.uuid4()
-    await manager.create(CompatTestModel, text=text)
-    text = "Test %s" % uuid.uuid4()
-    await manager.create(CompatTestModel, text=text)
+    await manager.execute(CompatTestModel.insert_many([
+        {'text': "Test %s" % uuid.uuid4()} for _ in range(3)
+    ]))
 
     count = await manager.count(CompatTestModel.select().limit(1))
     assert count == 1
@@ -37,12 +34,9 @@ async def test_count_query_with_limit(manager):
 
 @manager_for_all_dbs
 async def test_count_query(manager):
-    text = "Test %s" % uuid.uuid4()
-    await manager.create(CompatTestModel, text=text)
-    text = "Test %s" % uuid.uuid4()
-    await manager.create(CompatTestModel, text=text)
-    text = "Test %s" % uuid.uuid4()
-    await manager.create(CompatTestModel, text=text)
+    await manager.execute(CompatTestModel.insert_many([
+        {'text': "Test %s" % uuid.uuid4()} for _ in range(3)
+    ]))
 
     count = await manager.count(CompatTestModel.select())
     assert count == 3
@@ -51,10 +45,9 @@ async def test_count_query(manager):
 @manager_for_all_dbs
 async def test_scalar_query(manager):
 
-    text = "Test %s" % uuid.uuid4()
-    await manager.create(CompatTestModel, text=text)
-    text = "Test %s" % uuid.uuid4()
-    await manager.create(CompatTestModel, text=text)
+    await manager.execute(CompatTestModel.insert_many([
+        {'text': "Test %s" % uuid.uuid4()} for _ in range(2)
+    ]))
 
     fn = peewee.fn.Count(CompatTestModel.id)
     count = await manager.scalar(CompatTestModel.select(fn))
@@ -1,5 +1,6 @@
 import asyncio
 
+import peewee
 import pytest
 from peewee import sort_models
 
@@ -7,6 +8,9 @@ import peewee_async
 from tests.db_config import DB_CLASSES, DB_DEFAULTS
 from tests.models import ALL_MODELS
 
+# Models in reverse dependency order, for FK-safe row deletion.
+REVERSED_MODELS = tuple(reversed(sort_models(ALL_MODELS)))
+
 try:
     import aiopg
 except ImportError:
@@ -17,6 +21,12 @@ try:
 except ImportError:
     aiomysql = None
 
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
 
 @pytest.fixture(scope="session", autouse=True)
 def event_loop():
@@ -25,6 +35,59 @@ def event_loop():
     loop.close()
 
 
+# Backends for which the tables are already created. Table DDL is issued
+# only once per backend for the whole session, the per-test fixtures only
+# reset table contents.
+_created_schemas = set()
+
+
+def create_schema(db, database):
+    if db in _created_schemas:
+        return
+    with database.allow_sync():
+        for model in ALL_MODELS:
+            model.create_table(True)
+    _created_schemas.add(db)
+
+
+# Connectivity probe results per server, so an unreachable server is
+# detected once per session instead of timing out in every test.
+_server_probes = {}
+
+
+def probe_server(db, params):
+    key = (params['host'], params['port'])
+    if key not in _server_probes:
+        try:
+            database = DB_CLASSES[db](**params)
+            database.connect()
+            database.close()
+            _server_probes[key] = None
+        except Exception as exc:
+            _server_probes[key] = str(exc)
+    if _server_probes[key] is not None:
+        pytest.skip("%s server is not available: %s" % (db, _server_probes[key]))
+
+
+def truncate_tables(database):
+    """Reset table contents between tests. On PostgreSQL all tables are
+    truncated with a single statement, on MySQL `TRUNCATE` cannot touch
+    tables referenced by foreign keys, so rows are deleted in reverse
+    dependency order instead.
+    """
+    with database.allow_sync():
+        if isinstance(database, peewee.PostgresqlDatabase):
+            tables = ', '.join(
+                '"%s"' % model._meta.table_name for model in ALL_MODELS
+            )
+            database.execute_sql(
+                'TRUNCATE %s RESTART IDENTITY CASCADE' % tables
+            )
+        else:
+            for model in REVERSED_MODELS:
+                model.delete().execute()
+
+
 @pytest.fixture
 async def db(request):
     db = request.param
@@ -34,20 +97,19 @@ async def db(request):
         pytest.skip("aiomysql is not installed")
 
     params = DB_DEFAULTS[db]
+    probe_server(db, params)
     database = DB_CLASSES[db](**params)
     database._allow_sync = False
-    with database.allow_sync():
-        for model in ALL_MODELS:
-            model._meta.database = database
-            model.create_table(True)
+    for model in ALL_MODELS:
+        model._meta.database = database
+    create_schema(db, database)
+    truncate_tables(database)
 
     yield database
 
-    with database.allow_sync():
-        for model in reversed(sort_models(ALL_MODELS)):
-            model.delete().execute()
-            model._meta.database = None
     await database.aio_close()
+    for model in ALL_MODELS:
+        model._meta.database = None
 
 
 PG_DBS = [
@@ -74,6 +136,17 @@ postgres_only = pytest.mark.parametrize(
     "manager", PG_DBS, indirect=["manager"]
 )
 
+
+@pytest.fixture(scope="session")
+async def managers_cache():
+    """Databases and managers are built once per backend and kept warm
+    for the whole session; pools are closed when the session ends.
+    """
+    cache = {}
+    yield cache
+    for database, _ in cache.values():
+        await database.aio_close()
+
 mysql_only = pytest.mark.parametrize(
     "manager", MYSQL_DBS, indirect=["manager"]
 )
@@ -84,7 +157,7 @@ manager_for_all_dbs = pytest.mark.parametrize(
 
 
 @pytest.fixture
-async def manager(request):
+async def manager(request, managers_cache):
     db = request.param
     if db.startswith('postgres') and aiopg is None:
         pytest.skip("aiopg is not installed")
@@ -92,18 +165,26 @@ async def manager(request):
         pytest.skip("aiomysql is not installed")
 
     params = DB_DEFAULTS[db]
-    database = DB_CLASSES[db](**params)
-    database._allow_sync = False
-    manager = peewee_async.Manager(database)
-    with manager.allow_sync():
-        for model in ALL_MODELS:
+    probe_server(db, params)
+    if db in managers_cache:
+        database, manager = managers_cache[db]
+    else:
+        database = DB_CLASSES[db](**params)
+        database._allow_sync = False
+        manager = peewee_async.Manager(database)
+        managers_cache[db] = (database, manager)
+    for model in ALL_MODELS:
+        if model._meta.database is not database:
             model._meta.database = database
-            model.create_table(True)
-
-    yield peewee_async.Manager(database)
-
-    with manager.allow_sync():
-        for model in reversed(sort_models(ALL_MODELS)):
-            model.delete().execute()
-            model._meta.database = None
-    await database.close_async()
+    create_schema(db, database)
+    # Reset tables before the test rather than after, so the last test of
+    # a backend does not pay for a cleanup nobody observes. The sync reset
+    # runs on its own connection and overlaps with the pool warm-up, which
+    # is a no-op after the first test per backend.
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        loop.run_in_executor(None, truncate_tables, database),
+        database.aio_connect(),
+    )
+
+    yield manager
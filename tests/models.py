@@ -70,6 +70,17 @@ class IntegerTestModel(peewee_async.AioModel):
     num = peewee.IntegerField()
 
 
+class DeferredTestModel(peewee_async.AioModel):
+    """Model for the deferred-init and proxy tests which create and drop
+    the table themselves, so it is deliberately not in ALL_MODELS.
+    """
+    __test__ = False
+    text = peewee.CharField()
+
+    def __str__(self):
+        return '<%s id=%s> %s' % (self.__class__.__name__, self.id, self.text)
+
+
 ALL_MODELS = (
     TestModel, UUIDTestModel, TestModelAlpha, TestModelBeta, TestModelGamma,
     CompatTestModel, CompositeTestModel, IntegerTestModel
@@ -7,7 +7,10 @@ import pytest
 import peewee_async
 from tests.conftest import manager_for_all_dbs
 from tests.db_config import DB_CLASSES, DB_DEFAULTS
-from tests.models import UUIDTestModel, TestModelAlpha, CompositeTestModel, TestModel
+from tests.models import (
+    UUIDTestModel, TestModelAlpha, CompositeTestModel, TestModel,
+    DeferredTestModel,
+)
 
 
 @manager_for_all_dbs
@@ -64,23 +67,25 @@ async def test_select_many_objects(manager):
 @manager_for_all_dbs
 async def test_raw_query(manager):
 
-    text = "Test %s" % uuid.uuid4()
-    await manager.create(TestModel, text=text)
+    await manager.create(TestModel, text="Test raw query")
+
+    result1, result2, result3 = await asyncio.gather(
+        manager.execute(TestModel.raw(
+            'select id, text from testmodel')),
+        manager.execute(TestModel.raw(
+            'select id, text from testmodel').tuples()),
+        manager.execute(TestModel.raw(
+            'select id, text from testmodel').dicts()),
+    )
 
-    result1 = await manager.execute(TestModel.raw(
-        'select id, text from testmodel'))
     result1 = list(result1)
     assert len(result1) == 1
     assert isinstance(result1[0], TestModel) is True
 
-    result2 = await manager.execute(TestModel.raw(
-        'select id, text from testmodel').tuples())
     result2 = list(result2)
     assert len(result2) == 1
     assert isinstance(result2[0], tuple) is True
 
-    result3 = await manager.execute(TestModel.raw(
-        'select id, text from testmodel').dicts())
     result3 = list(result3)
     assert len(result3) == 1
     assert isinstance(result3[0], dict) is True
@@ -88,8 +93,7 @@ async def test_raw_query(manager):
 
 @manager_for_all_dbs
 async def test_get_obj_by_id(manager):
-    text = "Test %s" % uuid.uuid4()
-    obj1 = await manager.create(TestModel, text=text)
+    obj1 = await manager.create(TestModel, text="Test get by id")
     obj2 = await manager.get(TestModel, id=obj1.id)
 
     assert obj1 == obj2
@@ -99,8 +103,7 @@ async def test_get_obj_by_id(manager):
 @manager_for_all_dbs
 async def test_get_obj_by_uuid(manager):
 
-    text = "Test %s" % uuid.uuid4()
-    obj1 = await manager.create(UUIDTestModel, text=text)
+    obj1 = await manager.create(UUIDTestModel, text="Test get by uuid")
     obj2 = await manager.get(UUIDTestModel, id=obj1.id)
     assert obj1 == obj2
     assert len(str(obj1.id)) == 36
@@ -109,8 +112,7 @@ async def test_get_obj_by_uuid(manager):
 @manager_for_all_dbs
 async def test_create_uuid_obj(manager):
 
-    text = "Test %s" % uuid.uuid4()
-    obj = await manager.create(UUIDTestModel, text=text)
+    obj = await manager.create(UUIDTestModel, text="Test create uuid")
     assert len(str(obj.id)) == 36
 
 
@@ -130,13 +132,12 @@ async def test_allow_sync_is_reverted_for_exc(manager):
 async def test_many_requests(manager):
 
     max_connections = getattr(manager.database, 'max_connections', 1)
-    text = "Test %s" % uuid.uuid4()
-    obj = await manager.create(TestModel, text=text)
+    obj = await manager.create(TestModel, text="Test many requests")
     n = 2 * max_connections  # number of requests
-    done, not_done = await asyncio.wait(
-        {asyncio.create_task(manager.get(TestModel, id=obj.id)) for _ in range(n)}
+    results = await asyncio.gather(
+        *(manager.get(TestModel, id=obj.id) for _ in range(n))
     )
-    assert len(done) == n
+    assert len(results) == n
 
 
 @manager_for_all_dbs
@@ -159,24 +160,23 @@ async def test_connect_close(manager):
 
     assert manager.is_connected is False
 
-    done, not_done = await asyncio.wait({asyncio.create_task(get_conn(manager)) for _ in range(3)})
+    results = await asyncio.gather(*(get_conn(manager) for _ in range(3)))
 
-    conn = next(iter(done)).result()
-    assert len(done) == 3
+    conn = results[0]
+    assert len(results) == 3
     assert manager.is_connected is True
-    assert all(map(lambda t: t.result() == conn, done)) is True
+    assert all(c == conn for c in results) is True
 
     await manager.close()
     assert manager.is_connected is False
 
 
-@pytest.mark.parametrize(
-    "params, db_cls",
-    [
-        (DB_DEFAULTS[name], db_cls) for name, db_cls in DB_CLASSES.items()
-    ]
+DB_PARAMS = [
+    (DB_DEFAULTS[name], db_cls) for name, db_cls in DB_CLASSES.items()
+]
 
-)
+
+@pytest.mark.parametrize("params, db_cls", DB_PARAMS)
 async def test_deferred_init(params, db_cls):
 
     database = db_cls(None)
@@ -185,27 +185,22 @@ async def test_deferred_init(params, db_cls):
     database.init(**params)
     assert database.deferred is False
 
-    TestModel._meta.database = database
-    TestModel.create_table(True)
-    TestModel.drop_table(True)
+    DeferredTestModel._meta.database = database
+    DeferredTestModel.create_table(True)
+    DeferredTestModel.drop_table(True)
 
 
-@pytest.mark.parametrize(
-    "params, db_cls",
-    [
-        (DB_DEFAULTS[name], db_cls) for name, db_cls in DB_CLASSES.items()
-    ]
-)
+@pytest.mark.parametrize("params, db_cls", DB_PARAMS)
 async def test_proxy_database(params, db_cls):
     database = peewee.Proxy()
-    TestModel._meta.database = database
+    DeferredTestModel._meta.database = database
     manager = peewee_async.Manager(database)
 
     database.initialize(db_cls(**params))
 
-    TestModel.create_table(True)
+    DeferredTestModel.create_table(True)
 
     text = "Test %s" % uuid.uuid4()
-    await manager.create(TestModel, text=text)
-    await manager.get(TestModel, text=text)
-    TestModel.drop_table(True)
+    await manager.create(DeferredTestModel, text=text)
+    await manager.get(DeferredTestModel, text=text)
+    DeferredTestModel.drop_table(True)
@@ -46,8 +46,7 @@ async def test_prefetch(manager, prefetch_type):
 @manager_for_all_dbs
 async def test_update_obj(manager):
 
-    text = "Test %s" % uuid.uuid4()
-    obj1 = await manager.create(TestModel, text=text)
+    obj1 = await manager.create(TestModel, text="Test draft")
 
     obj1.text = "Test update object"
     await manager.update(obj1)